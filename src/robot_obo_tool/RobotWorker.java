@@ -0,0 +1,80 @@
+import java.io.BufferedOutputStream;
+import java.io.BufferedReader;
+import java.io.ByteArrayOutputStream;
+import java.io.FileDescriptor;
+import java.io.FileOutputStream;
+import java.io.IOException;
+import java.io.InputStreamReader;
+import java.io.OutputStream;
+import java.io.PrintStream;
+import java.lang.reflect.InvocationTargetException;
+import java.lang.reflect.Method;
+import java.nio.charset.StandardCharsets;
+
+/**
+ * Run ROBOT commands read from standard input inside a single, long-lived JVM.
+ *
+ * <p>This is launched by {@code robot_obo_tool.RobotDaemon} with {@code java -cp robot.jar
+ * RobotWorker.java}. After ROBOT is loaded, the worker writes {@code READY} on its own line.
+ * Each subsequent line of standard input is a command whose arguments are separated by NUL
+ * characters. For each command, the worker writes a header line {@code <status> <n_stdout>
+ * <n_stderr>} followed by that many bytes of captured standard out and standard error.
+ */
+public class RobotWorker {
+  public static void main(String[] argv) throws IOException {
+    OutputStream protocol = new BufferedOutputStream(new FileOutputStream(FileDescriptor.out));
+
+    // Swap out the standard streams before ROBOT is loaded, so its
+    // loggers pick up the captured streams instead of the originals
+    ByteArrayOutputStream out = new ByteArrayOutputStream();
+    ByteArrayOutputStream err = new ByteArrayOutputStream();
+    System.setOut(new PrintStream(out, true, "UTF-8"));
+    System.setErr(new PrintStream(err, true, "UTF-8"));
+
+    Method execute;
+    try {
+      execute =
+          Class.forName("org.obolibrary.robot.CommandLineInterface")
+              .getMethod("execute", String[].class);
+    } catch (ReflectiveOperationException | LinkageError e) {
+      write(protocol, "FAILED " + e + "\n");
+      System.exit(1);
+      return;
+    }
+    write(protocol, "READY\n");
+
+    BufferedReader stdin =
+        new BufferedReader(new InputStreamReader(System.in, StandardCharsets.UTF_8));
+    String line;
+    while ((line = stdin.readLine()) != null) {
+      String[] args = line.isEmpty() ? new String[0] : line.split("\0", -1);
+      out.reset();
+      err.reset();
+      int status = 0;
+      try {
+        execute.invoke(null, (Object) args);
+      } catch (InvocationTargetException e) {
+        status = 1;
+        e.getCause().printStackTrace();
+      } catch (ReflectiveOperationException e) {
+        status = 1;
+        e.printStackTrace();
+      }
+      System.out.flush();
+      System.err.flush();
+      byte[] stdout = out.toByteArray();
+      byte[] stderr = err.toByteArray();
+      protocol.write(
+          (status + " " + stdout.length + " " + stderr.length + "\n")
+              .getBytes(StandardCharsets.UTF_8));
+      protocol.write(stdout);
+      protocol.write(stderr);
+      protocol.flush();
+    }
+  }
+
+  private static void write(OutputStream stream, String text) throws IOException {
+    stream.write(text.getBytes(StandardCharsets.UTF_8));
+    stream.flush();
+  }
+}
@@ -1,12 +1,29 @@
 """A wrapper around ROBOT."""
 
-from .api import ROBOT_VERSION, ROBOTError, call, convert, ensure_jar, is_available
+from .api import (
+    ROBOT_VERSION,
+    RobotDaemon,
+    ROBOTError,
+    RobotPool,
+    call,
+    convert,
+    convert_many,
+    convert_pipeline,
+    ensure_catalog,
+    ensure_jar,
+    is_available,
+)
 
 __all__ = [
     "ROBOT_VERSION",
     "ROBOTError",
+    "RobotDaemon",
+    "RobotPool",
     "call",
     "convert",
+    "convert_many",
+    "convert_pipeline",
+    "ensure_catalog",
     "ensure_jar",
     "is_available",
 ]
@@ -3,43 +3,151 @@
 .. seealso:: https://robot.obolibrary.org
 """
 
+import atexit
 import logging
 import os
+import queue
+import shlex
 import subprocess
-from pathlib import Path
+import threading
+from collections import deque
+from collections.abc import Iterable
+from functools import lru_cache, partial
+from pathlib import Path, PurePosixPath
 from shutil import which
 from subprocess import check_output
-from textwrap import indent, shorten
-from typing import Literal
+from textwrap import indent
+from typing import IO, TYPE_CHECKING, Any, Literal
 
-import pystow
+if TYPE_CHECKING:
+    import asyncio
+
+    import pystow
+    from typing_extensions import Self
 
 __all__ = [
     "ROBOT_VERSION",
     "ROBOTError",
+    "RobotDaemon",
+    "RobotPool",
     "call",
     "convert",
+    "convert_many",
+    "convert_pipeline",
+    "ensure_catalog",
     "ensure_jar",
     "is_available",
 ]
 
 logger = logging.getLogger(__name__)
 
+#: The directory containing this module, which ROBOT is run from
+HERE = Path(__file__).parent.resolve()
+
 #: The default ROBOT version to download
 ROBOT_VERSION = "1.9.8"
-ROBOT_MODULE = pystow.module("robot")
 
 
+@lru_cache(maxsize=1)
+def _get_module() -> "pystow.Module":
+    """Get the :mod:`pystow` module for ROBOT, importing :mod:`pystow` on first use."""
+    import pystow
+
+    return pystow.module("robot")
+
+
+def __getattr__(name: str) -> Any:
+    # keep ROBOT_MODULE available without importing pystow eagerly
+    if name == "ROBOT_MODULE":
+        return _get_module()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@lru_cache
 def ensure_jar(*, version: str | None = None) -> Path:
-    """Ensure the ROBOT JAR is cached."""
+    """Ensure the ROBOT JAR is cached.
+
+    The resolved path is memoized for the lifetime of the process, so repeated
+    calls don't go back through :mod:`pystow`. Use ``ensure_jar.cache_clear()``
+    to force the path to be resolved again.
+    """
     if version is None:
         version = ROBOT_VERSION
+    module = _get_module()
+    # skip the URL handling and directory creation in
+    # pystow.Module.ensure() when the JAR is already there
+    path = module.join(name="robot.jar", version=version, ensure_exists=False)
+    if path.is_file():
+        return path
     url = f"https://github.com/ontodev/robot/releases/download/v{version}/robot.jar"
-    return ROBOT_MODULE.ensure(url=url, version=version)
+    return module.ensure(url=url, version=version)
+
+
+def ensure_catalog(iris: Iterable[str], path: str | Path | None = None) -> Path:
+    """Download ontologies and write an XML catalog that points ROBOT to them.
+
+    ROBOT downloads and parses an ontology's imports each time it loads the
+    ontology. Passing the resulting catalog to ``catalog_path`` in
+    :func:`convert` makes it read the local copies instead.
+
+    .. code-block:: python
+
+        from robot_obo_tool import convert, ensure_catalog
+
+        catalog_path = ensure_catalog(
+            [
+                "http://purl.obolibrary.org/obo/bfo.owl",
+                "http://purl.obolibrary.org/obo/ro.owl",
+            ]
+        )
+        convert("my-ontology.owl", "my-ontology.obo", catalog_path=catalog_path)
+
+    :param iris: The IRIs of the imported ontologies to download
+    :param path: Where to write the catalog. Defaults to ``catalog-v001.xml``
+        in the directory where :mod:`pystow` keeps the downloaded imports.
+    :return: The path to the catalog
+    """
+    from xml.sax.saxutils import quoteattr
+
+    module = _get_module()
+    lines = [
+        '<?xml version="1.0" encoding="UTF-8" standalone="no"?>',
+        '<catalog prefer="public" xmlns="urn:oasis:names:tc:entity:xmlns:xml:catalog">',
+    ]
+    for iri in iris:
+        directory, name = _get_import_key(iri)
+        local_path = module.ensure("imports", directory, url=iri, name=name)
+        lines.append(f"  <uri name={quoteattr(iri)} uri={quoteattr(local_path.as_uri())}/>")
+    lines.append("</catalog>")
+
+    rv = Path(path) if path is not None else module.join("imports", name="catalog-v001.xml")
+    rv.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return rv
+
+
+def _get_import_key(iri: str) -> tuple[str, str]:
+    """Get a directory and file name for an import that's unique to its IRI.
+
+    Files are kept in one directory per host. The name starts with a hash of the
+    whole IRI, so IRIs that only differ by query string, scheme, or path don't
+    overwrite each other, and ends with the last part of the path, if there is one.
+    """
+    import hashlib
+    from urllib.parse import urlparse
 
+    parsed = urlparse(iri)
+    digest = hashlib.sha256(iri.encode("utf-8")).hexdigest()[:16]
+    stem = PurePosixPath(parsed.path).name
+    return parsed.netloc or "_", f"{digest}-{stem}" if stem else digest
 
+
+@lru_cache
 def is_available(*, version: str | None = None) -> bool:
-    """Check if ROBOT is available."""
+    """Check if ROBOT is available.
+
+    The result is memoized, since checking requires starting Java. Use
+    ``is_available.cache_clear()`` to check again, e.g., after installing Java.
+    """
     if which("java") is None:
         # suggested in https://stackoverflow.com/questions/11210104/check-if-a-program-exists-from-a-python-script
         logger.error("java is not on the PATH")
@@ -60,34 +168,423 @@ def is_available(*, version: str | None = None) -> bool:
         # ROBOT was unsuccessfully downloaded
         return False
 
+    import zipfile
+
+    # checking the JAR's manifest is much faster than starting
+    # the JVM again to run ROBOT, which is only done as a fallback
+    try:
+        with zipfile.ZipFile(robot_jar_path) as jar:
+            manifest = jar.read("META-INF/MANIFEST.MF").decode("utf-8", errors="replace")
+    except zipfile.BadZipFile:
+        logger.error("ROBOT was downloaded to %s but is not a valid JAR", robot_jar_path)
+        return False
+    except KeyError:
+        manifest = ""
+    if any(line.startswith("Main-Class:") for line in manifest.splitlines()):
+        return True
+
     try:
-        call("--help")
+        call("--version", version=version)
     except Exception:
-        logger.error("ROBOT was downloaded to %s but could not be run with --help", robot_jar_path)
+        logger.error(
+            "ROBOT was downloaded to %s but could not be run with --version", robot_jar_path
+        )
         return False
 
     return True
 
 
-def call(*args: str, version: str | None = None) -> str:
-    """Run a ROBOT command and return the output as a string."""
-    rr = ["java", "-jar", str(ensure_jar(version=version)), *args]
+def call(*args: str, version: str | None = None, daemon: bool = False) -> str:
+    """Run a ROBOT command and return the output as a string.
+
+    :param args: The arguments to pass to ROBOT
+    :param version: the version of ROBOT to use
+    :param daemon: If true, run the command in a shared, long-lived
+        :class:`RobotDaemon` instead of starting a new JVM. This avoids paying
+        the JVM startup cost on each call.
+    :return: Output from standard out from running ROBOT
+    """
+    if daemon:
+        return _get_daemon(version or ROBOT_VERSION).call(*args)
+    return _run(_build_argv(args, version=version))
+
+
+def _build_argv(args: Iterable[str], *, version: str | None = None) -> list[str]:
+    # ensure_jar() is already memoized, so this stays cheap, and clearing
+    # its cache is enough to make the next call resolve the JAR again
+    return ["java", "-jar", str(ensure_jar(version=version)), *args]
+
+
+#: The maximum number of characters of standard error kept from a ROBOT command.
+#: This bounds memory use when ROBOT is verbose, e.g., with ``-vvv``.
+STDERR_LIMIT = 65_536
+
+#: The number of characters read from standard error at a time
+_CHUNK_SIZE = 8_192
+
+
+def _run(rr: list[str], *, cwd: str | Path = HERE) -> str:
     logger.debug("Running shell command: %s", rr)
+    chunks: deque[str] = deque()
+    with subprocess.Popen(  # noqa:S603
+        rr,
+        cwd=cwd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        bufsize=-1,
+        encoding="utf-8",
+        errors="replace",
+    ) as process:
+        # drain standard error in the background, so a verbose ROBOT
+        # can't block on a full pipe while standard out is being read
+        drainer = threading.Thread(target=_drain, args=(process.stderr, chunks), daemon=True)
+        drainer.start()
+        try:
+            stdout = process.stdout.read() if process.stdout is not None else ""
+            return_code = process.wait()
+        except BaseException:
+            # don't leave ROBOT running after an interrupt, since
+            # leaving the block would otherwise wait for it to finish
+            process.kill()
+            raise
+        finally:
+            drainer.join()
+
+    if return_code:
+        raise ROBOTError(
+            command=rr,
+            return_code=return_code,
+            output=stdout,
+            stderr="".join(chunks)[-STDERR_LIMIT:],
+        )
+    return stdout
+
+
+def _drain(stream: IO[str] | None, chunks: deque[str]) -> None:
+    """Read a stream to the end, keeping at least its last :data:`STDERR_LIMIT` characters."""
+    if stream is None:
+        return
+    size = 0
+    for chunk in iter(partial(stream.read, _CHUNK_SIZE), ""):
+        chunks.append(chunk)
+        size += len(chunk)
+        while size - len(chunks[0]) >= STDERR_LIMIT:
+            size -= len(chunks.popleft())
+
+
+async def _call_async(*args: str, version: str | None = None) -> str:
+    import asyncio
+
+    rr = _build_argv(args, version=version)
+    logger.debug("Running shell command: %s", rr)
+    process = await asyncio.create_subprocess_exec(
+        *rr,
+        cwd=HERE,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    stderr = bytearray()
     try:
-        ret = check_output(  # noqa:S603
-            rr,
-            cwd=os.path.dirname(__file__),
-            stderr=subprocess.PIPE,
+        stdout, _ = await asyncio.gather(
+            _read_async(process.stdout),
+            _drain_async(process.stderr, stderr),
         )
-    except subprocess.CalledProcessError as e:
+        return_code = await process.wait()
+    except BaseException:
+        # e.g., when cancelled because another job failed,
+        # don't leave an orphaned JVM writing output
+        if process.returncode is None:
+            process.kill()
+            await process.wait()
+        raise
+    if return_code:
         raise ROBOTError(
-            command=e.cmd,
-            return_code=e.returncode,
-            output=e.output.decode() if e.output is not None else None,
-            stderr=e.stderr.decode() if e.stderr is not None else None,
-        ) from None
+            command=rr,
+            return_code=return_code,
+            output=stdout.decode("utf-8", errors="replace"),
+            stderr=stderr.decode("utf-8", errors="replace"),
+        )
+    return stdout.decode("utf-8", errors="replace")
+
+
+async def _read_async(stream: "asyncio.StreamReader | None") -> bytes:
+    if stream is None:
+        return b""
+    return await stream.read()
+
+
+async def _drain_async(stream: "asyncio.StreamReader | None", buffer: bytearray) -> None:
+    if stream is None:
+        return
+    while chunk := await stream.read(_CHUNK_SIZE):
+        buffer.extend(chunk)
+        if len(buffer) > STDERR_LIMIT:
+            del buffer[: len(buffer) - STDERR_LIMIT]
+
+
+#: The Java source for the worker that backs :class:`RobotDaemon`
+WORKER_SOURCE = HERE.joinpath("RobotWorker.java")
+
+
+#: Characters that can't appear in arguments sent to the worker
+_WORKER_RESERVED = ("\n", "\r", "\0")
+
+
+class RobotDaemon:
+    """A long-lived ROBOT process that runs many commands in a single JVM.
+
+    Starting the JVM and loading ROBOT takes a few seconds, which dominates the
+    runtime of :func:`call` when it's used in a loop. A daemon pays this cost
+    once, then sends each command to the same process over standard input.
+
+    .. code-block:: python
 
-    return ret.decode()
+        from robot_obo_tool import RobotDaemon
+
+        with RobotDaemon() as daemon:
+            for prefix in ["pato", "go"]:
+                daemon.call(
+                    "convert",
+                    "-I",
+                    f"http://purl.obolibrary.org/obo/{prefix}.owl",
+                    "-o",
+                    f"{prefix}.obo",
+                )
+
+    If the worker can't be started, commands fall back to running one at a time
+    with :func:`call`.
+    """
+
+    def __init__(self, *, version: str | None = None) -> None:
+        """Initialize the daemon.
+
+        ROBOT isn't downloaded and the worker isn't started until the first call,
+        or until the daemon is entered as a context manager.
+
+        :param version: the version of ROBOT to use
+        """
+        self.version = version or ROBOT_VERSION
+        self._process: subprocess.Popen[bytes] | None = None
+        self._stderr: IO[bytes] | None = None
+        self._fallback = False
+        self._lock = threading.Lock()
+
+    @property
+    def command(self) -> list[str]:
+        """Get the command that starts the worker, downloading ROBOT if needed."""
+        return ["java", "-cp", str(ensure_jar(version=self.version)), str(WORKER_SOURCE)]
+
+    def __enter__(self) -> "Self":
+        self.start()
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def start(self) -> None:
+        """Start the worker process, if it's not already running."""
+        if self._process is not None or self._fallback:
+            return
+        import tempfile
+
+        command = self.command
+        logger.debug("Starting ROBOT daemon: %s", command)
+        # standard error goes to a file rather than a pipe, so the worker can't
+        # block on it, but it can still explain why the worker failed to start,
+        # e.g., if Java is older than 11 or doesn't include a compiler
+        stderr = tempfile.TemporaryFile()  # noqa:SIM115
+        process = subprocess.Popen(  # noqa:S603
+            command,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=stderr,
+            cwd=HERE,
+            bufsize=-1,
+        )
+        line = process.stdout.readline() if process.stdout is not None else b""
+        if line != b"READY\n":
+            process.kill()
+            process.wait()
+            stderr.seek(0)
+            message = _truncate(stderr.read().decode("utf-8", errors="replace").strip(), 2_000)
+            stderr.close()
+            logger.warning(
+                "ROBOT daemon failed its health check, falling back to one-shot calls: %s",
+                "\n".join(part for part in (line.decode().strip(), message) if part)
+                or "no response",
+            )
+            self._fallback = True
+            return
+        self._process = process
+        self._stderr = stderr
+        atexit.register(self.close)
+
+    def close(self) -> None:
+        """Stop the worker process."""
+        process, self._process = self._process, None
+        if process is None:
+            return
+        atexit.unregister(self.close)
+        self._close_stderr()
+        if process.stdin is not None:
+            process.stdin.close()
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+
+    def _close_stderr(self) -> None:
+        stderr, self._stderr = self._stderr, None
+        if stderr is not None:
+            stderr.close()
+
+    def call(self, *args: str) -> str:
+        """Run a ROBOT command in the worker and return the output as a string.
+
+        :param args: The arguments to pass to ROBOT
+        :return: Output from standard out from running ROBOT
+        :raises ValueError: If an argument contains a line break or NUL character,
+            which can't be sent to the worker
+        :raises ROBOTError: If the command fails
+        """
+        # the worker reads commands with BufferedReader.readLine(),
+        # which ends a line at any of \n, \r, or \r\n
+        if any(char in arg for arg in args for char in _WORKER_RESERVED):
+            raise ValueError("arguments can not contain line break or NUL characters")
+        with self._lock:
+            self.start()
+            if self._process is None:
+                return call(*args, version=self.version)
+            return self._call(self._process, args)
+
+    def _call(self, process: subprocess.Popen[bytes], args: tuple[str, ...]) -> str:
+        if process.stdin is None or process.stdout is None:  # pragma: no cover
+            raise RuntimeError("worker process is missing pipes")
+        logger.debug("Running ROBOT daemon command: %s", args)
+        try:
+            process.stdin.write("\0".join(args).encode() + b"\n")
+            process.stdin.flush()
+        except BrokenPipeError:
+            pass
+        header = process.stdout.readline().split()
+        if len(header) != 3:
+            # the worker died, e.g., because ROBOT called System.exit().
+            # clean up so the next call starts a new one
+            self._process = None
+            atexit.unregister(self.close)
+            self._close_stderr()
+            raise ROBOTError(
+                command=_build_argv(args, version=self.version),
+                return_code=process.wait(),
+                stderr="ROBOT daemon exited unexpectedly",
+            )
+        return_code, n_stdout, n_stderr = map(int, header)
+        stdout = process.stdout.read(n_stdout).decode("utf-8", errors="replace")
+        stderr = process.stdout.read(n_stderr).decode("utf-8", errors="replace")
+        if return_code:
+            raise ROBOTError(
+                command=_build_argv(args, version=self.version),
+                return_code=return_code,
+                output=stdout,
+                stderr=stderr,
+            )
+        return stdout
+
+
+@lru_cache
+def _get_daemon(version: str) -> RobotDaemon:
+    return RobotDaemon(version=version)
+
+
+class RobotPool:
+    """A pool of :class:`RobotDaemon` workers that run ROBOT commands in parallel.
+
+    Reasoning over large ontologies keeps the JVM busy, so running independent
+    conversions in parallel needs several JVMs. Each worker in the pool is a
+    long-lived daemon that runs one command at a time:
+
+    .. code-block:: python
+
+        from robot_obo_tool import RobotPool
+
+        jobs = [
+            {
+                "input_path": f"http://purl.obolibrary.org/obo/{prefix}.owl",
+                "output_path": f"{prefix}.obo",
+                "reason": True,
+            }
+            for prefix in ["pato", "go", "uberon"]
+        ]
+        with RobotPool(2) as pool:
+            pool.map(jobs)
+    """
+
+    def __init__(self, n: int | None = None, *, version: str | None = None) -> None:
+        """Initialize the pool, whose workers are started lazily.
+
+        :param n: The number of workers. Defaults to the number of CPUs, up to 8,
+            since each worker is a JVM that can use up to a quarter of the
+            memory by default.
+        :param version: the version of ROBOT to use
+        :raises ValueError: If there are fewer than one workers
+        """
+        if n is None:
+            n = min(8, os.cpu_count() or 1)
+        elif n < 1:
+            raise ValueError(f"a pool needs at least one worker, got {n}")
+        self.version = version or ROBOT_VERSION
+        self.daemons = [RobotDaemon(version=self.version) for _ in range(n)]
+        self._idle: queue.Queue[RobotDaemon] = queue.Queue()
+        for daemon in self.daemons:
+            self._idle.put(daemon)
+
+    def __enter__(self) -> "Self":
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Stop all workers."""
+        for daemon in self.daemons:
+            daemon.close()
+
+    def call(self, *args: str) -> str:
+        """Run a ROBOT command on the next idle worker.
+
+        :param args: The arguments to pass to ROBOT
+        :return: Output from standard out from running ROBOT
+        """
+        daemon = self._idle.get()
+        try:
+            return daemon.call(*args)
+        finally:
+            self._idle.put(daemon)
+
+    def map(self, jobs: Iterable[dict[str, Any]]) -> list[str]:
+        """Run several conversions in parallel across the workers.
+
+        :param jobs: An iterable of dictionaries, each containing the keyword
+            arguments for a call to :func:`convert`, like in :func:`convert_many`
+        :return: Output from standard out from running ROBOT, for each job in order
+        :raises ValueError: If a job asks for a different version of ROBOT than
+            the one the pool runs
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        arguments = []
+        for job in jobs:
+            job = dict(job)
+            version = job.pop("version", None)
+            if version is not None and version != self.version:
+                raise ValueError(
+                    f"job uses ROBOT {version}, but the pool runs ROBOT {self.version}"
+                )
+            arguments.append(_get_convert_args(**job))
+
+        with ThreadPoolExecutor(max_workers=len(self.daemons)) as executor:
+            return list(executor.map(lambda args: self.call(*args), arguments))
 
 
 def convert(
@@ -101,6 +598,7 @@ def convert(
     reason: bool = False,
     extra_args: list[str] | None = None,
     debug: bool = False,
+    catalog_path: str | Path | None = None,
     version: str | None = None,
 ) -> str:
     """Convert an OBO file to an OWL file with ROBOT.
@@ -125,68 +623,227 @@ def convert(
         Extra positional arguments to pass in the command line
     :param debug:
         Turn on -vvv
+    :param catalog_path: An XML catalog that maps import IRIs to local files,
+        so ROBOT doesn't download them again. See :func:`ensure_catalog`.
     :param version: the version of ROBOT to use
     :return: Output from standard out from running ROBOT
     """
-    if input_flag is None:
-        input_flag = "-I" if _is_remote(input_path) else "-i"
+    args = _get_convert_args(
+        input_path,
+        output_path,
+        input_flag,
+        merge=merge,
+        fmt=fmt,
+        check=check,
+        reason=reason,
+        extra_args=extra_args,
+        debug=debug,
+        catalog_path=catalog_path,
+    )
+    return call(*args, version=version)
 
-    args: list[str] = []
 
-    if merge and not reason:
-        args.extend(["merge", str(input_flag), str(input_path), "convert"])
-    elif merge and reason:
-        args.extend(
-            [
-                "merge",
-                str(input_flag),
-                str(input_path),
-                "reason",
-                "convert",
-            ]
-        )
-    elif not merge and reason:
-        args.extend(
-            [
-                "reason",
-                str(input_flag),
-                str(input_path),
-                "convert",
-            ]
-        )
-    else:
-        args.extend(
+async def convert_many(
+    jobs: Iterable[dict[str, Any]],
+    *,
+    concurrency: int | None = None,
+) -> list[str]:
+    """Run several conversions with ROBOT concurrently.
+
+    .. code-block:: python
+
+        import asyncio
+
+        from robot_obo_tool import convert_many
+
+        jobs = [
+            {
+                "input_path": f"http://purl.obolibrary.org/obo/{prefix}.owl",
+                "output_path": f"{prefix}.obo",
+            }
+            for prefix in ["pato", "go", "uberon"]
+        ]
+        asyncio.run(convert_many(jobs))
+
+    :param jobs: An iterable of dictionaries, each containing the keyword
+        arguments for a call to :func:`convert`
+    :param concurrency: The maximum number of ROBOT processes to run at the same
+        time. Defaults to the number of CPUs, up to 8.
+    :return: Output from standard out from running ROBOT, for each job in order
+    :raises ValueError: If the concurrency is less than one
+    """
+    import asyncio
+
+    if concurrency is None:
+        concurrency = min(8, os.cpu_count() or 1)
+    elif concurrency < 1:
+        raise ValueError(f"concurrency must be at least one, got {concurrency}")
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _convert(job: dict[str, Any]) -> str:
+        job = dict(job)
+        version = job.pop("version", None)
+        args = _get_convert_args(**job)
+        async with semaphore:
+            return await _call_async(*args, version=version)
+
+    tasks = [asyncio.ensure_future(_convert(job)) for job in jobs]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        # stop the remaining jobs, which kills their ROBOT processes
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
+def convert_pipeline(
+    input_path: str | Path,
+    outputs: Iterable[tuple[str | Path, dict[str, Any]]],
+    input_flag: Literal["-i", "-I"] | None = None,
+    *,
+    merge: bool = False,
+    reason: bool = False,
+    debug: bool = False,
+    catalog_path: str | Path | None = None,
+    version: str | None = None,
+) -> str:
+    """Convert an ontology to several outputs with a single ROBOT command.
+
+    Calling :func:`convert` once per output means starting ROBOT and parsing the
+    ontology again each time. This chains several ``convert`` commands together
+    so the ontology is only loaded (and optionally merged and reasoned) once.
+
+    .. code-block:: python
+
+        from robot_obo_tool import convert_pipeline
+
+        convert_pipeline(
+            "https://raw.githubusercontent.com/pato-ontology/pato/master/pato.owl",
             [
-                "convert",
-                str(input_flag),
-                str(input_path),
-            ]
+                ("pato.obo", {"check": False}),
+                ("pato.json", {}),
+                ("pato.ofn", {"fmt": "ofn"}),
+            ],
         )
 
-    args.extend(("-o", str(output_path)))
+    :param input_path: Either a local file path or IRI. If a local file path
+        is used, pass ``"-i"`` to ``flag``. If an IRI is used, pass ``"-I"``
+        to ``flag``.
+    :param outputs: Pairs of local file paths to save the converted ontology to
+        and dictionaries of options for each. The options can include ``fmt``,
+        ``check``, and ``extra_args``, which work the same as in :func:`convert`.
+    :param input_flag: The flag to denote if the file is local or remote.
+        Tries to infer from input string if none is given
+    :param merge: Use ROBOT's merge command to squash all graphs together
+    :param reason:
+        Turn on ontology reasoning
+    :param debug:
+        Turn on -vvv
+    :param catalog_path: An XML catalog that maps import IRIs to local files,
+        so ROBOT doesn't download them again. See :func:`ensure_catalog`.
+    :param version: the version of ROBOT to use
+    :return: Output from standard out from running ROBOT
+    :raises ValueError: If no outputs are given
+    """
+    outputs = list(outputs)
+    if not outputs:
+        raise ValueError("no outputs given")
+    args = _get_input_args(
+        input_path, input_flag, merge=merge, reason=reason, catalog_path=catalog_path
+    )
+    for i, (output_path, options) in enumerate(outputs):
+        if i:
+            args.append("convert")
+        args.extend(_get_output_args(output_path, **options))
+    if debug:
+        args.append("-vvv")
+    return call(*args, version=version)
+
+
+def _get_convert_args(
+    input_path: str | Path,
+    output_path: str | Path,
+    input_flag: Literal["-i", "-I"] | None = None,
+    *,
+    merge: bool = False,
+    fmt: str | None = None,
+    check: bool = True,
+    reason: bool = False,
+    extra_args: list[str] | None = None,
+    debug: bool = False,
+    catalog_path: str | Path | None = None,
+) -> list[str]:
+    args = _get_input_args(
+        input_path, input_flag, merge=merge, reason=reason, catalog_path=catalog_path
+    )
+    args.extend(_get_output_args(output_path, fmt=fmt, check=check, extra_args=extra_args))
+    if debug:
+        args.append("-vvv")
+    return args
+
+
+#: The chain of ROBOT commands that loads an ontology, keyed by whether to merge and reason
+_INPUT_COMMANDS: dict[tuple[bool, bool], tuple[str, ...]] = {
+    (False, False): ("convert",),
+    (True, False): ("merge", "convert"),
+    (False, True): ("reason", "convert"),
+    (True, True): ("merge", "reason", "convert"),
+}
+
+
+def _get_input_args(
+    input_path: str | Path,
+    input_flag: Literal["-i", "-I"] | None = None,
+    *,
+    merge: bool = False,
+    reason: bool = False,
+    catalog_path: str | Path | None = None,
+) -> list[str]:
+    """Get the ROBOT commands that load an ontology, ending with ``convert``."""
+    if input_flag is None:
+        input_flag = "-I" if _is_remote(input_path) else "-i"
+
+    # the input (and the catalog used to resolve its imports)
+    # is always given to the first command in the chain
+    first, *rest = _INPUT_COMMANDS[merge, reason]
+    args = [first]
+    if catalog_path is not None:
+        args.extend(("--catalog", str(catalog_path)))
+    args.extend((input_flag, str(input_path), *rest))
+    return args
+
+
+def _get_output_args(
+    output_path: str | Path,
+    *,
+    fmt: str | None = None,
+    check: bool = True,
+    extra_args: list[str] | None = None,
+) -> list[str]:
+    """Get the arguments for a ROBOT ``convert`` command's output."""
+    args = ["-o", str(output_path)]
     if extra_args:
         args.extend(extra_args)
     if not check:
         args.append("--check=false")
     if fmt:
         args.extend(("--format", fmt))
-    if debug:
-        args.append("-vvv")
-
-    return call(*args, version=version)
+    return args
 
 
 #: Prefixes that denote remote resources
-PROTOCOLS = {
+PROTOCOLS = (
     "https://",
     "http://",
     "ftp://",
     "ftps://",
-}
+)
 
 
 def _is_remote(url: str | Path) -> bool:
-    return isinstance(url, str) and any(url.startswith(protocol) for protocol in PROTOCOLS)
+    return isinstance(url, str) and url.startswith(PROTOCOLS)
 
 
 class ROBOTError(Exception):
@@ -210,23 +867,28 @@ class ROBOTError(Exception):
             error message preview. Default is 500 characters.
 
         The error message will contain the command, return code, and a preview
-        of the output truncated to preview_length characters.
+        of the output truncated to preview_length characters. It's only built
+        when the error is converted to a string.
         """
         self.command = command
         self.return_code = return_code
         self.stdout = output or "<no stdout>"
         self.preview_length = preview_length
         self.stderr = stderr or "<no stderr>"
-
-        # Create the error message
-        command_str = " ".join(command)
-        stdout_preview = indent(shorten(self.stdout, preview_length), "  ")
-        stderr_preview = indent(shorten(self.stderr, preview_length), "  ")
-
-        message = (
-            f"Command `{command_str}` returned non-zero exit status {return_code}.\n\n"
+        super().__init__(f"ROBOT exited with status {return_code}")
+
+    def __str__(self) -> str:
+        command_str = shlex.join(self.command)
+        stdout_preview = indent(_truncate(self.stdout, self.preview_length), "  ")
+        stderr_preview = indent(_truncate(self.stderr, self.preview_length), "  ")
+        return (
+            f"Command `{command_str}` returned non-zero exit status {self.return_code}.\n\n"
             f"stderr:\n\n{stderr_preview}"
             f"\n\nstdout:\n\n{stdout_preview}"
         )
 
-        super().__init__(message)
+
+def _truncate(text: str, length: int) -> str:
+    if len(text) <= length:
+        return text
+    return text[:length] + "…"
@@ -0,0 +1,146 @@
+"""Run ROBOT inside the Python process with JPype.
+
+Each call in :mod:`robot_obo_tool.api` starts a new Java virtual machine (JVM).
+This module instead starts a JVM once, inside the Python process, using
+`JPype <https://jpype.readthedocs.io>`_, then calls ROBOT's Java API directly.
+It requires the ``embedded`` extra:
+
+.. code-block:: console
+
+    $ pip install robot-obo-tool[embedded]
+
+If JPype isn't installed, :func:`call` and :func:`convert` fall back to running
+ROBOT in a subprocess, like :mod:`robot_obo_tool.api` does.
+
+.. warning::
+
+    Only one JVM can be started per process, so the version of ROBOT is fixed
+    by the first call. Unlike :mod:`robot_obo_tool.api`, relative paths are
+    resolved against the current working directory.
+"""
+
+import threading
+from pathlib import Path
+from typing import Literal
+
+from .api import ROBOT_VERSION, ROBOTError, _build_argv, _get_convert_args, _run, ensure_jar
+
+try:
+    import jpype
+except ImportError:  # pragma: no cover
+    jpype = None
+
+__all__ = [
+    "call",
+    "convert",
+    "is_available",
+]
+
+#: Guards swapping Java's standard out, which is global to the JVM
+_LOCK = threading.Lock()
+
+#: The version of ROBOT that's been loaded in the JVM
+_STARTED_VERSION: str | None = None
+
+
+def is_available() -> bool:
+    """Check if JPype is installed, so ROBOT can be run inside the Python process."""
+    return jpype is not None
+
+
+def _ensure_jvm(version: str) -> None:
+    global _STARTED_VERSION
+    if _STARTED_VERSION is None:
+        if not jpype.isJVMStarted():
+            jpype.startJVM(classpath=[str(ensure_jar(version=version))], convertStrings=False)
+        _STARTED_VERSION = version
+    elif _STARTED_VERSION != version:
+        raise ValueError(
+            f"ROBOT {_STARTED_VERSION} is already loaded in the JVM, so {version} can't be used"
+        )
+
+
+def call(*args: str, version: str | None = None) -> str:
+    """Run a ROBOT command inside the Python process and return the output as a string.
+
+    If JPype isn't installed, this falls back to running ROBOT in a subprocess
+    from the current working directory.
+
+    :param args: The arguments to pass to ROBOT
+    :param version: the version of ROBOT to use
+    :return: Output from standard out from running ROBOT
+    :raises ROBOTError: If the command fails
+    """
+    if jpype is None:
+        # run from the current working directory, so relative paths
+        # resolve the same way as they would in-process
+        return _run(_build_argv(args, version=version), cwd=Path.cwd())
+    version = version or ROBOT_VERSION
+    with _LOCK:
+        _ensure_jvm(version)
+        system = jpype.JClass("java.lang.System")
+        stream = jpype.JClass("java.io.ByteArrayOutputStream")()
+        original = system.out
+        system.setOut(jpype.JClass("java.io.PrintStream")(stream, True, "UTF-8"))
+        try:
+            jpype.JClass("org.obolibrary.robot.CommandLineInterface").execute(
+                jpype.JArray(jpype.JString)(list(args))
+            )
+        except jpype.JException as e:
+            raise ROBOTError(
+                command=["robot", *args],
+                return_code=1,
+                output=str(stream.toString("UTF-8")),
+                stderr=str(e.stacktrace()),
+            ) from None
+        finally:
+            system.setOut(original)
+        return str(stream.toString("UTF-8"))
+
+
+def convert(
+    input_path: str | Path,
+    output_path: str | Path,
+    input_flag: Literal["-i", "-I"] | None = None,
+    *,
+    merge: bool = False,
+    fmt: str | None = None,
+    check: bool = True,
+    reason: bool = False,
+    extra_args: list[str] | None = None,
+    debug: bool = False,
+    catalog_path: str | Path | None = None,
+    version: str | None = None,
+) -> str:
+    """Convert an ontology with ROBOT inside the Python process.
+
+    This takes the same arguments as :func:`robot_obo_tool.api.convert`. Like
+    :func:`call`, it falls back to a subprocess if JPype isn't installed.
+
+    :param input_path: Either a local file path or IRI
+    :param output_path: The local file path to save the converted ontology to
+    :param input_flag: The flag to denote if the file is local or remote.
+        Tries to infer from input string if none is given
+    :param merge: Use ROBOT's merge command to squash all graphs together
+    :param fmt: Explicitly set the format
+    :param check: Should the OBO writer enforce document structure rules?
+    :param reason: Turn on ontology reasoning
+    :param extra_args: Extra positional arguments to pass in the command line
+    :param debug: Turn on -vvv
+    :param catalog_path: An XML catalog that maps import IRIs to local files
+    :param version: the version of ROBOT to use
+    :return: Output from standard out from running ROBOT
+    """
+    args = _get_convert_args(
+        input_path,
+        output_path,
+        input_flag,
+        merge=merge,
+        fmt=fmt,
+        check=check,
+        reason=reason,
+        extra_args=extra_args,
+        debug=debug,
+        catalog_path=catalog_path,
+    )
+    return call(*args, version=version)
@@ -1,10 +1,34 @@
 """Trivial version test."""
 
+import asyncio
+import io
+import signal
+import sys
 import tempfile
+import time
 import unittest
 from pathlib import Path
+from typing import Any
+from unittest import mock
+from urllib.parse import urlparse
+from xml.etree import ElementTree
 
-from robot_obo_tool.api import ROBOTError, convert, ensure_jar, is_available
+from robot_obo_tool.api import (
+    STDERR_LIMIT,
+    RobotDaemon,
+    ROBOTError,
+    RobotPool,
+    _build_argv,
+    _get_convert_args,
+    _is_remote,
+    _run,
+    convert,
+    convert_many,
+    convert_pipeline,
+    ensure_catalog,
+    ensure_jar,
+    is_available,
+)
 from robot_obo_tool.version import get_version
 
 
@@ -39,3 +63,288 @@ class TestVersion(unittest.TestCase):
                 'property_value: dc:title "PATO - the Phenotype And Trait Ontology" xsd:string',
                 path.read_text(),
             )
+
+    def test_daemon(self) -> None:
+        """Test running several commands in the same ROBOT daemon."""
+        with RobotDaemon() as daemon:
+            first = daemon.call("--version")
+            self.assertIn("ROBOT version", first)
+            self.assertEqual(first, daemon.call("--version"))
+            with self.assertRaises(ROBOTError):
+                daemon.call("convert", "-i", "does-not-exist.owl", "-o", "out.obo")
+
+    def test_convert_args(self) -> None:
+        """Test building the arguments for a conversion."""
+        self.assertEqual(
+            ["convert", "-i", "in.owl", "-o", "out.obo"],
+            _get_convert_args("in.owl", "out.obo"),
+        )
+        self.assertEqual(
+            ["convert", "-I", "https://example.org/in.owl", "-o", "out.obo", "--check=false"],
+            _get_convert_args("https://example.org/in.owl", "out.obo", check=False),
+        )
+        self.assertEqual(
+            ["merge", "-i", "in.owl", "reason", "convert", "-o", "out.obo", "--format", "obo"],
+            _get_convert_args("in.owl", "out.obo", merge=True, reason=True, fmt="obo"),
+        )
+        self.assertEqual(
+            ["reason", "-i", "in.owl", "convert", "-o", "out.obo", "-vvv"],
+            _get_convert_args("in.owl", "out.obo", reason=True, debug=True),
+        )
+        self.assertEqual(
+            ["merge", "--catalog", "catalog.xml", "-i", "in.owl", "convert", "-o", "out.obo"],
+            _get_convert_args("in.owl", "out.obo", merge=True, catalog_path="catalog.xml"),
+        )
+
+    def test_convert_pipeline(self) -> None:
+        """Test converting to several outputs with one ROBOT command."""
+        with self.assertRaises(ValueError):
+            convert_pipeline("in.owl", [])
+        with tempfile.TemporaryDirectory() as tmpdir:
+            directory = Path(tmpdir)
+            uri = "https://raw.githubusercontent.com/pato-ontology/pato/master/pato.owl"
+            convert_pipeline(
+                uri,
+                [
+                    (directory.joinpath("pato.obo"), {"check": False}),
+                    (directory.joinpath("pato.ofn"), {"fmt": "ofn"}),
+                ],
+            )
+            self.assertTrue(directory.joinpath("pato.obo").is_file())
+            self.assertTrue(directory.joinpath("pato.ofn").is_file())
+
+    def test_convert_pipeline_args(self) -> None:
+        """Test each output after the first gets its own convert command and options."""
+        with mock.patch("robot_obo_tool.api.call", return_value="ok") as call:
+            convert_pipeline(
+                "in.owl",
+                [("a.obo", {"check": False}), ("b.ofn", {"fmt": "ofn"})],
+                debug=True,
+            )
+        call.assert_called_once_with(
+            "convert",
+            "-i",
+            "in.owl",
+            "-o",
+            "a.obo",
+            "--check=false",
+            "convert",
+            "-o",
+            "b.ofn",
+            "--format",
+            "ofn",
+            "-vvv",
+            version=None,
+        )
+
+    def test_run_bounded_stderr(self) -> None:
+        """Test that a verbose command's standard error is drained and truncated."""
+        script = "import sys; sys.stderr.write('x' * 1_000_000 + 'end'); print('out'); sys.exit(3)"
+        with self.assertRaises(ROBOTError) as context:
+            _run([sys.executable, "-c", script])
+        self.assertEqual(3, context.exception.return_code)
+        self.assertEqual("out\n", context.exception.stdout)
+        self.assertEqual(STDERR_LIMIT, len(context.exception.stderr))
+        self.assertTrue(context.exception.stderr.endswith("end"))
+
+    @unittest.skipUnless(hasattr(signal, "setitimer"), "needs interval timers")
+    def test_run_interrupted(self) -> None:
+        """Test that an interrupted command is killed instead of waited on."""
+
+        def _interrupt(signum: int, frame: object) -> None:
+            raise KeyboardInterrupt
+
+        original = signal.signal(signal.SIGALRM, _interrupt)
+        start = time.monotonic()
+        try:
+            signal.setitimer(signal.ITIMER_REAL, 0.5)
+            with self.assertRaises(KeyboardInterrupt):
+                _run([sys.executable, "-c", "import time; time.sleep(30)"])
+        finally:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, original)
+        self.assertLess(time.monotonic() - start, 10)
+
+    def test_is_remote(self) -> None:
+        """Test detecting remote resources."""
+        self.assertTrue(_is_remote("https://example.org/in.owl"))
+        self.assertTrue(_is_remote("ftp://example.org/in.owl"))
+        self.assertFalse(_is_remote("in.owl"))
+        self.assertFalse(_is_remote(Path("https://example.org/in.owl")))
+
+    def test_error_message(self) -> None:
+        """Test the error message is built with a truncated preview."""
+        error = ROBOTError(["robot", "my file.owl"], 1, output="a" * 1000, preview_length=20)
+        self.assertEqual(1, error.return_code)
+        self.assertEqual("a" * 1000, error.stdout)
+        self.assertEqual(
+            "Command `robot 'my file.owl'` returned non-zero exit status 1.\n\n"
+            "stderr:\n\n  <no stderr>\n\nstdout:\n\n  " + "a" * 20 + "…",
+            str(error),
+        )
+
+    def test_pool(self) -> None:
+        """Test running several commands across a pool of ROBOT daemons."""
+        with RobotPool(2) as pool:
+            versions = [pool.call("--version") for _ in range(3)]
+        self.assertEqual(1, len(set(versions)))
+
+    def test_convert_many(self) -> None:
+        """Test running conversions concurrently, with ROBOT replaced by a Python script."""
+        # prints the output path, fails if it's "fail", and writes it after a delay if it's slow
+        script = (
+            "import sys, time\n"
+            "path = sys.argv[sys.argv.index('-o') + 1]\n"
+            "print(path)\n"
+            "if path == 'fail':\n"
+            "    sys.exit(1)\n"
+            "if path.endswith('slow'):\n"
+            "    time.sleep(1.5)\n"
+            "    open(path, 'w').close()\n"
+        )
+
+        def _build_argv(args: list[str], *, version: str | None = None) -> list[str]:
+            return [sys.executable, "-c", script, *args]
+
+        with mock.patch("robot_obo_tool.api._build_argv", _build_argv):
+            results = asyncio.run(
+                convert_many(
+                    [{"input_path": "in.owl", "output_path": f"out{i}.obo"} for i in range(5)],
+                    concurrency=2,
+                )
+            )
+            self.assertEqual([f"out{i}.obo\n" for i in range(5)], results)
+
+            with tempfile.TemporaryDirectory() as tmpdir:
+                slow = Path(tmpdir).joinpath("slow")
+                jobs: list[dict[str, Any]] = [
+                    {"input_path": "in.owl", "output_path": "fail"},
+                    {"input_path": "in.owl", "output_path": slow},
+                ]
+                with self.assertRaises(ROBOTError) as context:
+                    asyncio.run(convert_many(jobs))
+                self.assertEqual(1, context.exception.return_code)
+                # the slow job is killed, so it never writes its output
+                time.sleep(2)
+                self.assertFalse(slow.exists())
+
+    def test_convert_many_concurrency(self) -> None:
+        """Test a concurrency below one is rejected, instead of hanging on the first job."""
+        jobs = [{"input_path": "in.owl", "output_path": "out.obo"}]
+        for concurrency in [0, -1]:
+            with self.subTest(concurrency=concurrency), self.assertRaises(ValueError):
+                asyncio.run(convert_many(jobs, concurrency=concurrency))
+
+    def test_ensure_catalog(self) -> None:
+        """Test writing a catalog, with downloads replaced by a mock pystow module."""
+        iris = [
+            "http://example.org/onto.owl?version=1",
+            "http://example.org/onto.owl?version=2",
+            "http://example.org/",
+            "http://example.org/a/onto.owl",
+            "https://example.org/a/onto.owl",
+        ]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            directory = Path(tmpdir)
+
+            def _ensure(*subkeys: str, url: str, name: str) -> Path:
+                path = directory.joinpath(*subkeys, name)
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_text(url)
+                return path
+
+            module = mock.Mock()
+            module.ensure.side_effect = _ensure
+            catalog_path = directory.joinpath("catalog.xml")
+            with mock.patch("robot_obo_tool.api._get_module", return_value=module):
+                self.assertEqual(catalog_path, ensure_catalog(iris, catalog_path))
+
+            root = ElementTree.parse(catalog_path).getroot()  # noqa:S314
+            mapping = {
+                element.attrib["name"]: element.attrib["uri"]
+                for element in root.iter("{urn:oasis:names:tc:entity:xmlns:xml:catalog}uri")
+            }
+            self.assertEqual(set(iris), set(mapping))
+            self.assertEqual(len(iris), len(set(mapping.values())))
+            for iri, uri in mapping.items():
+                self.assertEqual(iri, Path(urlparse(uri).path).read_text())
+
+    def test_daemon_fallback(self) -> None:
+        """Test the daemon falls back to one-shot calls and reports why the worker failed."""
+        command = [sys.executable, "-c", "import sys; sys.stderr.write('no compiler'); sys.exit(1)"]
+        with (
+            mock.patch.object(RobotDaemon, "command", new_callable=mock.PropertyMock) as prop,
+            mock.patch("robot_obo_tool.api.call", return_value="one-shot") as call,
+            self.assertLogs("robot_obo_tool.api", level="WARNING") as logs,
+        ):
+            prop.return_value = command
+            daemon = RobotDaemon()
+            self.assertEqual("one-shot", daemon.call("--version"))
+        call.assert_called_once_with("--version", version=daemon.version)
+        self.assertIn("no compiler", "\n".join(logs.output))
+
+    def test_pool_versions(self) -> None:
+        """Test the pool accepts the same jobs as convert_many, as long as the version matches."""
+        with (
+            RobotPool(2, version="1.9.8") as pool,
+            mock.patch.object(pool, "call", return_value="ok") as call,
+        ):
+            jobs = [
+                {"input_path": "in.owl", "output_path": "out.obo", "version": "1.9.8"},
+                {"input_path": "in.owl", "output_path": "out.ofn"},
+            ]
+            self.assertEqual(["ok", "ok"], pool.map(jobs))
+            self.assertEqual(2, call.call_count)
+            with self.assertRaises(ValueError):
+                pool.map([{"input_path": "in.owl", "output_path": "out.obo", "version": "1.9.7"}])
+
+    def test_pool_size(self) -> None:
+        """Test a pool without any workers is rejected, instead of hanging on its first call."""
+        for n in [0, -1]:
+            with self.subTest(n=n), self.assertRaises(ValueError):
+                RobotPool(n)
+
+    def test_daemon_reserved_characters(self) -> None:
+        """Test the daemon rejects arguments that would be split into several commands."""
+        daemon = RobotDaemon()
+        for arg in ["a\nb", "a\rb", "a\0b"]:
+            with self.subTest(arg=arg), self.assertRaises(ValueError):
+                daemon.call("convert", "-i", arg)
+
+    def test_daemon_error(self) -> None:
+        """Test a failed daemon command reports a one-shot command that reproduces it."""
+        reply = b"1 4 7\nout\xffstd\xfferr"
+
+        def _build_argv(args: list[str], *, version: str | None = None) -> list[str]:
+            return ["robot", *args]
+
+        process = mock.Mock()
+        process.stdout = io.BytesIO(reply)
+        with (
+            mock.patch("robot_obo_tool.api._build_argv", _build_argv),
+            self.assertRaises(ROBOTError) as context,
+        ):
+            RobotDaemon()._call(process, ("convert", "-i", "my file.owl"))
+        self.assertEqual(["robot", "convert", "-i", "my file.owl"], context.exception.command)
+        self.assertEqual("out\ufffd", context.exception.stdout)
+        self.assertEqual("std\ufffderr", context.exception.stderr)
+
+    def test_build_argv_cache_clear(self) -> None:
+        """Test clearing the JAR cache makes the next command resolve the JAR again."""
+        with mock.patch("robot_obo_tool.api._get_module") as get_module:
+            get_module.return_value.join.return_value = Path("missing.jar")
+            get_module.return_value.ensure.side_effect = [Path("first.jar"), Path("second.jar")]
+            ensure_jar.cache_clear()
+            try:
+                self.assertEqual(
+                    ["java", "-jar", "first.jar", "--version"], _build_argv(["--version"])
+                )
+                self.assertEqual(
+                    ["java", "-jar", "first.jar", "--version"], _build_argv(["--version"])
+                )
+                ensure_jar.cache_clear()
+                self.assertEqual(
+                    ["java", "-jar", "second.jar", "--version"], _build_argv(["--version"])
+                )
+            finally:
+                ensure_jar.cache_clear()
@@ -0,0 +1,62 @@
+"""Test running ROBOT inside the Python process."""
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from robot_obo_tool import embedded
+from robot_obo_tool.api import ROBOTError
+
+
+@unittest.skipUnless(embedded.is_available(), "JPype is not installed")
+class TestEmbedded(unittest.TestCase):
+    """Test running ROBOT inside the Python process."""
+
+    def test_call(self) -> None:
+        """Test running several commands in the same JVM."""
+        first = embedded.call("--version")
+        self.assertIn("ROBOT version", first)
+        self.assertEqual(first, embedded.call("--version"))
+        with self.assertRaises(ROBOTError):
+            embedded.call("convert", "-i", "does-not-exist.owl", "-o", "out.obo")
+
+    def test_convert(self) -> None:
+        """Test converting a remote ontology in-process."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir).joinpath("pato.obo")
+            uri = "https://raw.githubusercontent.com/pato-ontology/pato/master/pato.owl"
+            embedded.convert(uri, path, check=False)
+            self.assertIn(
+                'property_value: dc:title "PATO - the Phenotype And Trait Ontology" xsd:string',
+                path.read_text(),
+            )
+
+
+class TestFallback(unittest.TestCase):
+    """Test falling back to a subprocess when JPype isn't installed."""
+
+    def test_call(self) -> None:
+        """Test the fallback runs ROBOT from the current working directory."""
+        with (
+            mock.patch("robot_obo_tool.embedded.jpype", None),
+            mock.patch("robot_obo_tool.embedded._build_argv", lambda args, version: list(args)),
+            mock.patch("robot_obo_tool.embedded._run", return_value="ok") as run,
+        ):
+            self.assertEqual("ok", embedded.call("--version"))
+        run.assert_called_once_with(["--version"], cwd=Path.cwd())
+
+    def test_convert(self) -> None:
+        """Test the fallback runs the same arguments as in-process, from the working directory."""
+        with (
+            mock.patch("robot_obo_tool.embedded.jpype", None),
+            mock.patch("robot_obo_tool.embedded._build_argv", lambda args, version: list(args)),
+            mock.patch("robot_obo_tool.embedded._run", return_value="ok") as run,
+        ):
+            self.assertEqual(
+                "ok", embedded.convert("in.owl", "out.obo", catalog_path="catalog.xml")
+            )
+        run.assert_called_once_with(
+            ["convert", "--catalog", "catalog.xml", "-i", "in.owl", "-o", "out.obo"],
+            cwd=Path.cwd(),
+        )